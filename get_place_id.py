@@ -1,21 +1,56 @@
+import orjson
+import random
 import requests
 import os
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 load_dotenv()
 
+
+class _JitteredRetry(Retry):
+    """Retry with random jitter added to the exponential backoff.
+
+    urllib3 1.26 (pinned in requirements) has no backoff_jitter option.
+    """
+
+    def get_backoff_time(self):
+        backoff = super().get_backoff_time()
+        return backoff + random.uniform(0, backoff) if backoff else 0
+
+
+# Shared session so repeated lookups reuse the keep-alive connection; timeouts,
+# rate limiting and transient server errors are retried like pricing.services
+_session = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=_JitteredRetry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(408, 429, 500, 502, 503, 504),
+    ),
+)
+_session.mount('https://', _adapter)
+_session.mount('http://', _adapter)
+
+# Parameters shared by every find-place lookup
+_FIND_PLACE_PARAMS = {
+    'inputtype': 'textquery',
+    'fields': 'place_id,name,formatted_address',
+}
+
 def get_place_id(api_key, place_name, location):
     base_url = "https://maps.googleapis.com/maps/api/place/findplacefromtext/json"
-    params = {
+    params = _FIND_PLACE_PARAMS | {
         'input': place_name,
-        'inputtype': 'textquery',
         'locationbias': f'point:{location}',
-        'fields': 'place_id,name,formatted_address',
         'key': api_key
     }
     
-    response = requests.get(base_url, params=params)
-    return response.json()
+    response = _session.get(base_url, params=params, timeout=(3, 10))
+    return orjson.loads(response.content)
 
 if __name__ == "__main__":
     api_key = os.getenv('GOOGLE_MAPS_API_KEY')
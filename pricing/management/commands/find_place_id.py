@@ -1,5 +1,6 @@
+import asyncio
 from django.core.management.base import BaseCommand
-from pricing.services import GooglePlacesService
+from pricing.services import GooglePlacesService, close_client
 
 class Command(BaseCommand):
     help = 'Find Google Place ID for a restaurant'
@@ -13,7 +14,13 @@ class Command(BaseCommand):
         latitude = 40.7631
         longitude = -73.5267
         
-        results = service.search_place(options['restaurant_name'], latitude, longitude)
+        async def search():
+            try:
+                return await service.search_place(options['restaurant_name'], latitude, longitude)
+            finally:
+                await close_client()
+
+        results = asyncio.run(search())
         
         if 'results' in results:
             self.stdout.write(self.style.SUCCESS('Search Results:'))
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.17 on 2026-10-15 14:54
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("pricing", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name="busytimesdata",
+            unique_together={("restaurant", "day_of_week", "hour")},
+        ),
+    ]
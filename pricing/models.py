@@ -21,3 +21,8 @@ class BusyTimesData(models.Model):
     day_of_week = models.IntegerField()  # 0-6 for Monday-Sunday
     hour = models.IntegerField()  # 0-23
     busyness_level = models.FloatField()  # 0-1 scale
+
+    class Meta:
+        # One row per restaurant/time slot; the unique index also serves
+        # lookups by (restaurant, day_of_week, hour)
+        unique_together = [('restaurant', 'day_of_week', 'hour')]
@@ -14,12 +14,138 @@ Key Features:
 - Weather data integration
 - Dynamic pricing calculations
 - Competitor analysis
+
+All outbound HTTP calls are asynchronous (httpx, HTTP/2 where the server
+supports it) so that independent API requests can be awaited concurrently
+from the async views.
 """
 
 import os
-import requests
-from typing import Dict, List, Optional, Union
-import json
+import asyncio
+import weakref
+import httpx
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
+from dataclasses import dataclass
+import numpy as np
+from django.core.cache import cache
+from typing import Dict, List, Optional, Tuple, Union
+import orjson
+
+# API keys, resolved once at import (settings loads .env before apps import)
+GOOGLE_MAPS_API_KEY = os.getenv('GOOGLE_MAPS_API_KEY')
+OPENWEATHER_API_KEY = os.getenv('OPENWEATHER_API_KEY')
+
+_PLACES_BASE_URL = 'https://maps.googleapis.com/maps/api/place'
+_WEATHER_URL = 'http://api.openweathermap.org/data/2.5/weather'
+
+# Per-attempt timeouts (seconds): 3s to connect, 5s for each read/write/pool wait
+_TIMEOUT = httpx.Timeout(5, connect=3)
+
+# Overall deadline (seconds) for one API call, including retries and backoff
+_DEADLINE = 10
+
+# Connection pool shared by both services. Only two hosts are called, so the
+# total cap of 10 also bounds concurrent connections to each of them; idle
+# connections are kept warm for 75s
+_LIMITS = httpx.Limits(max_connections=10, max_keepalive_connections=10, keepalive_expiry=75)
+
+# HTTP statuses worth retrying: timeouts, rate limiting and transient server errors
+_RETRY_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+
+# Maximum concurrent Places details requests issued by a single batch
+_DETAILS_CONCURRENCY = 8
+
+# Bump to invalidate every cached API response on deploy
+CACHE_VERSION = 1
+
+# Cache lifetimes (seconds) for Google Places responses
+DETAILS_CACHE_TTL = 6 * 60 * 60  # restaurant details rarely change
+NEARBY_CACHE_TTL = 60 * 60
+
+# Cache lifetime (seconds) for OpenWeather responses
+WEATHER_CACHE_TTL = 10 * 60
+
+# One AsyncClient per event loop. The app is served over ASGI (see README),
+# where there is a single loop, so the connection pool is shared by every
+# request served by the process.
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+
+async def get_client() -> httpx.AsyncClient:
+    """
+    Get the shared httpx client for the running event loop.
+
+    The client is created lazily on first use and reused afterwards, so
+    consecutive calls to Google and OpenWeather keep their TCP/TLS
+    connections alive instead of re-handshaking every time. Google endpoints
+    negotiate HTTP/2, so concurrent Places calls are multiplexed over a
+    single connection.
+
+    Returns:
+        httpx.AsyncClient: Client bound to the current event loop
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(http2=True, limits=_LIMITS, timeout=_TIMEOUT)
+        _clients[loop] = client
+    return client
+
+
+async def close_client() -> None:
+    """Close the shared httpx client for the running event loop, if any."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """Retry transport failures and transient HTTP statuses, never other 4xx."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in _RETRY_STATUSES
+    return isinstance(exc, httpx.TransportError)
+
+
+@retry(
+    retry=retry_if_exception(_is_retryable),
+    wait=wait_exponential_jitter(initial=0.3, max=5),
+    stop=stop_after_attempt(4),
+    reraise=True,
+)
+async def _get_with_retries(url: str, params: Dict) -> httpx.Response:
+    """
+    Issue a GET request on the shared client, retrying transient failures.
+
+    Connection errors, timeouts and 408/429/5xx responses are retried up to
+    four attempts with jittered exponential backoff; the last error is
+    re-raised for the caller to handle.
+    """
+    client = await get_client()
+    response = await client.get(url, params=params)
+    if response.status_code in _RETRY_STATUSES:
+        response.raise_for_status()
+    return response
+
+
+async def _get(url: str, params: Dict) -> httpx.Response:
+    """
+    Issue a GET request, giving up after _DEADLINE seconds in total.
+
+    Raises:
+        asyncio.TimeoutError: If the request (with retries) exceeds the deadline
+    """
+    return await asyncio.wait_for(_get_with_retries(url, params), _DEADLINE)
+
+
+def _describe_error(exc: BaseException) -> str:
+    """Describe a failed API call in a form that is safe to show to users."""
+    # The HTTPStatusError text includes the request URL, API key and all
+    if isinstance(exc, httpx.HTTPStatusError):
+        return f"HTTP {exc.response.status_code} from {exc.request.url.host}"
+    if isinstance(exc, asyncio.TimeoutError):
+        return f"request timed out after {_DEADLINE}s"
+    return str(exc)
+
 
 class GooglePlacesService:
     """
@@ -35,10 +161,31 @@ class GooglePlacesService:
 
     def __init__(self):
         """Initialize the service with API key from environment variables."""
-        self.api_key = os.getenv('GOOGLE_MAPS_API_KEY')
-        self.base_url = 'https://maps.googleapis.com/maps/api/place'
-
-    def search_place(self, query: str, latitude: str, longitude: str) -> Dict:
+        self.api_key = GOOGLE_MAPS_API_KEY
+        self.base_url = _PLACES_BASE_URL
+        # Constant request parameters, built once and merged into each call
+        self._search_params = {
+            'radius': '5000',  # 5km radius
+            'type': 'restaurant',
+            'key': self.api_key
+        }
+        self._details_params = {
+            'fields': 'name,rating,formatted_address,price_level,photos,geometry,opening_hours',
+            'key': self.api_key
+        }
+        self._nearby_params = {
+            'radius': '1000',  # 1km radius
+            'type': 'restaurant',
+            'key': self.api_key
+        }
+        # In-flight details lookups, keyed by (event loop, place_id) because
+        # tasks are loop-bound. Under ASGI all requests share one loop, so
+        # concurrent page views of a place are deduplicated; under WSGI
+        # (runserver) each request has its own loop and only lookups within
+        # one request, e.g. batch_place_details, are.
+        self._inflight: Dict[tuple, asyncio.Task] = {}
+
+    async def search_place(self, query: str, latitude: str, longitude: str) -> Dict:
         """
         Search for restaurants using the Google Places API.
 
@@ -64,22 +211,22 @@ class GooglePlacesService:
         """
         try:
             url = f"{self.base_url}/textsearch/json"
-            params = {
+            params = self._search_params | {
                 'query': query,
-                'location': f"{latitude},{longitude}",
-                'radius': '5000',  # 5km radius
-                'type': 'restaurant',
-                'key': self.api_key
+                'location': f"{latitude},{longitude}"
             }
-            response = requests.get(url, params=params)
-            return response.json()
+            response = await _get(url, params)
+            return orjson.loads(response.content)
         except Exception as e:
-            return {'error_message': f"Failed to search place: {str(e)}"}
+            return {'error_message': f"Failed to search place: {_describe_error(e)}"}
 
-    def get_restaurant_details(self, place_id: str) -> Dict:
+    async def get_restaurant_details(self, place_id: str) -> Dict:
         """
         Get detailed information about a specific restaurant.
 
+        Responses with status OK are cached for DETAILS_CACHE_TTL seconds, and
+        concurrent calls for the same place_id share one in-flight request.
+
         Args:
             place_id (str): Google Places ID for the restaurant
 
@@ -98,22 +245,80 @@ class GooglePlacesService:
                     'error_message': Optional[str]
                 }
         """
+        cache_key = f"places:details:{place_id}"
+        cached = await cache.aget(cache_key, version=CACHE_VERSION)
+        if cached is not None:
+            return cached
+
+        # Concurrent lookups of the same place on this event loop share a
+        # single API request
+        loop = asyncio.get_running_loop()
+        inflight_key = (loop, place_id)
+        task = self._inflight.get(inflight_key)
+        if task is None:
+            task = loop.create_task(self._fetch_restaurant_details(place_id, cache_key))
+            self._inflight[inflight_key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(inflight_key, None))
+        # Shield so one cancelled caller doesn't cancel the shared request
+        return await asyncio.shield(task)
+
+    async def _fetch_restaurant_details(self, place_id: str, cache_key: str) -> Dict:
+        """Fetch restaurant details from the API and cache successful responses."""
         try:
             url = f"{self.base_url}/details/json"
-            params = {
-                'place_id': place_id,
-                'fields': 'name,rating,formatted_address,price_level,photos,geometry,opening_hours',
-                'key': self.api_key
-            }
-            response = requests.get(url, params=params)
-            return response.json()
+            params = self._details_params | {'place_id': place_id}
+            response = await _get(url, params)
+            data = orjson.loads(response.content)
         except Exception as e:
-            return {'error_message': f"Failed to get place details: {str(e)}"}
+            return {'error_message': f"Failed to get place details: {_describe_error(e)}"}
+
+        # Google reports failures (UNKNOWN_ERROR, NOT_FOUND, ...) with HTTP 200,
+        # so only cache responses whose status says they succeeded
+        if data.get('status') == 'OK':
+            await cache.aset(cache_key, data, DETAILS_CACHE_TTL, version=CACHE_VERSION)
+        return data
+
+    async def batch_place_details(self, place_ids: List[str]) -> List[Dict]:
+        """
+        Get details for several restaurants concurrently.
 
-    def search_nearby_restaurants(self, latitude: float, longitude: float) -> Dict:
+        At most _DETAILS_CONCURRENCY requests are in flight at once to stay
+        within Google's QPS limits.
+
+        Args:
+            place_ids (List[str]): Google Places IDs of the restaurants
+
+        Returns:
+            List[Dict]: Restaurant details in the same order as place_ids,
+                each shaped like the get_restaurant_details response
+        """
+        semaphore = asyncio.Semaphore(_DETAILS_CONCURRENCY)
+
+        async def fetch_one(place_id: str) -> Dict:
+            async with semaphore:
+                return await self.get_restaurant_details(place_id)
+
+        results = await asyncio.gather(
+            *(fetch_one(place_id) for place_id in place_ids),
+            return_exceptions=True
+        )
+        details = []
+        for result in results:
+            # Cancellation must propagate rather than become an error entry
+            if isinstance(result, asyncio.CancelledError):
+                raise result
+            if isinstance(result, BaseException):
+                result = {'error_message': f"Failed to get place details: {_describe_error(result)}"}
+            details.append(result)
+        return details
+
+    async def search_nearby_restaurants(self, latitude: float, longitude: float) -> Dict:
         """
         Search for nearby restaurants within 1km radius.
 
+        Responses with status OK or ZERO_RESULTS are cached for
+        NEARBY_CACHE_TTL seconds.
+
         Args:
             latitude (float): Center point latitude
             longitude (float): Center point longitude
@@ -133,20 +338,26 @@ class GooglePlacesService:
                     'error_message': Optional[str]
                 }
         """
+        # Coordinates rounded to ~10m so near-identical lookups share an entry
+        cache_key = f"places:nearby:{round(latitude, 4)}:{round(longitude, 4)}"
+        cached = await cache.aget(cache_key, version=CACHE_VERSION)
+        if cached is not None:
+            return cached
+
         try:
             url = f"{self.base_url}/nearbysearch/json"
-            params = {
-                'location': f"{latitude},{longitude}",
-                'radius': '1000',  # 1km radius
-                'type': 'restaurant',
-                'key': self.api_key
-            }
-            response = requests.get(url, params=params)
-            return response.json()
+            params = self._nearby_params | {'location': f"{latitude},{longitude}"}
+            response = await _get(url, params)
+            data = orjson.loads(response.content)
         except Exception as e:
-            return {'error_message': f"Failed to search nearby restaurants: {str(e)}"}
+            return {'error_message': f"Failed to search nearby restaurants: {_describe_error(e)}"}
 
-    def get_place_busy_times(self, place_id: str) -> int:
+        # An empty neighbourhood is a valid answer; any other non-OK status is not
+        if data.get('status') in ('OK', 'ZERO_RESULTS'):
+            await cache.aset(cache_key, data, NEARBY_CACHE_TTL, version=CACHE_VERSION)
+        return data
+
+    async def get_place_busy_times(self, place_id: str) -> int:
         """
         Get current busy level for a restaurant.
         
@@ -174,13 +385,16 @@ class WeatherService:
 
     def __init__(self):
         """Initialize the service with API key from environment variables."""
-        self.api_key = os.getenv('OPENWEATHER_API_KEY')
-        self.base_url = 'http://api.openweathermap.org/data/2.5/weather'
+        self.api_key = OPENWEATHER_API_KEY
+        self.base_url = _WEATHER_URL
+        self._params = {'appid': self.api_key}
 
-    def get_current_weather(self, latitude: float, longitude: float) -> Dict:
+    async def get_current_weather(self, latitude: float, longitude: float) -> Dict:
         """
         Get current weather data for a location.
 
+        Successful responses are cached for WEATHER_CACHE_TTL seconds.
+
         Args:
             latitude (float): Location latitude
             longitude (float): Location longitude
@@ -199,16 +413,23 @@ class WeatherService:
                     }]
                 }
         """
+        # Coordinates rounded to ~1km; weather doesn't vary within that tile
+        cache_key = f"weather:{round(latitude, 2)}:{round(longitude, 2)}"
+        cached = await cache.aget(cache_key, version=CACHE_VERSION)
+        if cached is not None:
+            return cached
+
         try:
-            params = {
-                'lat': latitude,
-                'lon': longitude,
-                'appid': self.api_key
-            }
-            response = requests.get(self.base_url, params=params)
-            return response.json()
+            params = self._params | {'lat': latitude, 'lon': longitude}
+            response = await _get(self.base_url, params)
+            data = orjson.loads(response.content)
         except Exception as e:
-            return {'error': f"Failed to get weather data: {str(e)}"}
+            return {'error': f"Failed to get weather data: {_describe_error(e)}"}
+
+        # Only cache actual observations, not API error payloads
+        if 'main' in data:
+            await cache.aset(cache_key, data, WEATHER_CACHE_TTL, version=CACHE_VERSION)
+        return data
 
     @staticmethod
     def kelvin_to_fahrenheit(kelvin: float) -> float:
@@ -223,6 +444,58 @@ class WeatherService:
         """
         return (kelvin - 273.15) * 9/5 + 32
 
+# Weather conditions that count as "bad weather" for pricing
+_BAD_WEATHER = frozenset({'Rain', 'Snow', 'Thunderstorm'})
+
+# 45°F expressed in Kelvin, so temperatures need no conversion when compared
+_COLD_KELVIN = (45 - 32) * 5/9 + 273.15
+
+
+@dataclass(frozen=True)
+class PricingContext:
+    """
+    Request-level pricing decision, derived once from weather and busy level.
+
+    Weather and busy level are the same for every menu item on a page, so the
+    markup decision is made once here instead of once per item.
+
+    Attributes:
+        use_markup (bool): Whether the cold/bad weather + busy markup applies
+        markup (float): Multiplier applied to the lowest competitor price (1.1 to 1.3)
+    """
+    use_markup: bool
+    markup: float
+
+    @classmethod
+    def from_conditions(cls, weather_data: Dict, busy_level: int) -> 'PricingContext':
+        """
+        Build the pricing context for the current conditions.
+
+        Args:
+            weather_data (Dict): Current weather conditions
+                {
+                    'temp': float,  # Temperature in Kelvin
+                    'weather': [{'main': str}]  # Weather condition
+                }
+            busy_level (int): Current restaurant busy level (0-100)
+
+        Returns:
+            PricingContext: Markup decision for these conditions
+        """
+        # Define what "busier than usual" means (>70%)
+        busier_than_usual = busy_level > 70
+
+        # Cheapest tests first, so the weather is only inspected when the
+        # restaurant is busy; the temperature is compared in Kelvin directly
+        if busier_than_usual and (
+            weather_data.get('weather', [{'main': 'Clear'}])[0].get('main', 'Clear') in _BAD_WEATHER
+            or weather_data.get('temp', 293.15) < _COLD_KELVIN
+        ):
+            # Add 10-20% markup depending on how busy
+            return cls(use_markup=True, markup=1.1 + (busy_level - 70) / 100)
+        return cls(use_markup=False, markup=1.0)
+
+
 class PricingService:
     """
     Service for calculating dynamic menu item prices.
@@ -250,6 +523,9 @@ class PricingService:
         """
         Calculate the optimal price based on conditions and competition.
 
+        When pricing several items for the same conditions, build a
+        PricingContext once and use calculate_price_fast instead.
+
         Args:
             base_price (float): Original menu item price
             weather_data (Dict): Current weather conditions
@@ -269,29 +545,97 @@ class PricingService:
             >>> price = service.calculate_price(15.99, weather, 80, [14.99, 16.99])
             >>> print(f"${price:.2f}")  # $16.49
         """
+        context = PricingContext.from_conditions(weather_data, busy_level)
+        return self.calculate_price_fast(base_price, competitor_prices, context)
+
+    def calculate_price_fast(
+        self,
+        base_price: float,
+        competitor_prices: List[float],
+        context: PricingContext
+    ) -> float:
+        """
+        Calculate the optimal price using a precomputed pricing context.
+
+        Args:
+            base_price (float): Original menu item price
+            competitor_prices (List[float]): List of competitor prices for similar items
+            context (PricingContext): Markup decision for the current conditions
+
+        Returns:
+            float: Calculated optimal price
+        """
         if not competitor_prices:
             return base_price
 
         lowest_price = min(competitor_prices)
-        
-        # Convert temperature from Kelvin to Fahrenheit
-        temp_kelvin = weather_data.get('temp', 293.15)  # Default to 20°C
-        temp_f = (temp_kelvin - 273.15) * 9/5 + 32
-        
-        # Check weather condition
-        weather_conditions = weather_data.get('weather', [{'main': 'Clear'}])[0].get('main', 'Clear')
-        bad_weather = weather_conditions in ['Rain', 'Snow', 'Thunderstorm']
-        
-        # Define what "busier than usual" means (>70%)
-        busier_than_usual = busy_level > 70
-        
-        # Apply pricing logic
-        if (temp_f < 45 or bad_weather) and busier_than_usual:
-            # Add 10-20% markup depending on how busy
-            markup = 1.1 + (busy_level - 70) / 100  # 1.1 to 1.3 markup
-            return max(lowest_price * markup, base_price)
-        else:
-            return lowest_price
+        if context.use_markup:
+            return max(lowest_price * context.markup, base_price)
+        return lowest_price
+
+    def calculate_prices_batch(
+        self,
+        base_prices: np.ndarray,
+        context: PricingContext,
+        price_levels: np.ndarray
+    ) -> np.ndarray:
+        """
+        Calculate optimal prices for a whole menu in one vectorized pass.
+
+        Applies the same rules as calculate_price to every item, with the
+        competitor prices of item i given by base_prices[i] * price_levels.
+
+        Args:
+            base_prices (np.ndarray): Original menu item prices, shape (n_items,)
+            context (PricingContext): Markup decision for the current conditions
+            price_levels (np.ndarray): Competitor price multipliers
+                (price_level / 2), shape (n_competitors,)
+
+        Returns:
+            np.ndarray: Calculated optimal prices, shape (n_items,)
+
+        Example:
+            >>> service = PricingService()
+            >>> weather = {'temp': 283.15, 'weather': [{'main': 'Rain'}]}
+            >>> context = PricingContext.from_conditions(weather, 80)
+            >>> service.calculate_prices_batch(
+            ...     np.array([15.99, 3.99]), context, np.array([1.0, 1.5])
+            ... )  # array([19.188, 4.788])
+        """
+        if price_levels.size == 0:
+            return base_prices.astype(float)
+
+        # Prices are positive, so min(base * levels) == base * min(levels)
+        lowest_prices = base_prices * price_levels.min()
+        if context.use_markup:
+            return np.maximum(lowest_prices * context.markup, base_prices)
+        return lowest_prices
+
+    def calculate_menu(
+        self,
+        base_prices: np.ndarray,
+        weather_data: Dict,
+        busy_level: int,
+        price_levels: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Price a whole menu and compute each item's percentage change.
+
+        Args:
+            base_prices (np.ndarray): Original menu item prices, shape (n_items,)
+            weather_data (Dict): Current weather conditions (see calculate_price)
+            busy_level (int): Current restaurant busy level (0-100)
+            price_levels (np.ndarray): Competitor price multipliers
+                (price_level / 2), shape (n_competitors,)
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: New prices and percentage change
+                from the base price, both shape (n_items,)
+        """
+        context = PricingContext.from_conditions(weather_data, busy_level)
+        new_prices = self.calculate_prices_batch(base_prices, context, price_levels)
+        price_changes = (new_prices - base_prices) / base_prices * 100
+        return new_prices, price_changes
 
     def get_sample_menu(self) -> List[Dict]:
         """
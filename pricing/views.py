@@ -1,17 +1,32 @@
+import asyncio
+import numpy as np
+from django.core.handlers.asgi import ASGIRequest
 from django.shortcuts import render
 from django.views import View
 from datetime import datetime
-from .services import GooglePlacesService, WeatherService, PricingService
+from itertools import islice
+from .services import (
+    GooglePlacesService, WeatherService, PricingService, GOOGLE_MAPS_API_KEY, close_client
+)
 from .models import Restaurant, MenuItem, WeatherData, BusyTimesData
-import os
+
+# Services are stateless per request, so one instance per process is shared by
+# every request (and keeps the in-flight lookup table process-wide)
+_google_service = GooglePlacesService()
+_weather_service = WeatherService()
+_pricing_service = PricingService()
 
 class PricingView(View):
-    def __init__(self):
-        self.google_service = GooglePlacesService()
-        self.weather_service = WeatherService()
-        self.pricing_service = PricingService()
+    async def get(self, request):
+        try:
+            return await self._get(request)
+        finally:
+            # Outside ASGI (e.g. runserver) Django runs each async view on its
+            # own short-lived event loop, so release that loop's HTTP client
+            if not isinstance(request, ASGIRequest):
+                await close_client()
 
-    def get(self, request):
+    async def _get(self, request):
         search_query = request.GET.get('restaurant')
         selected_place_id = request.GET.get('place_id')
         
@@ -21,7 +36,7 @@ class PricingView(View):
         
         if search_query and not selected_place_id:
             # Search for restaurants and show results
-            search_results = self.google_service.search_place(
+            search_results = await _google_service.search_place(
                 search_query,
                 request.GET.get('latitude', '40.7631'),  # Default to Hicksville coordinates
                 request.GET.get('longitude', '-73.5267')
@@ -30,13 +45,13 @@ class PricingView(View):
             context = {
                 'search_query': search_query,
                 'restaurants': search_results.get('results', []),
-                'google_maps_api_key': os.getenv('GOOGLE_MAPS_API_KEY'),
+                'google_maps_api_key': GOOGLE_MAPS_API_KEY,
                 'error_message': search_results.get('error_message')
             }
             return render(request, 'pricing/search_results.html', context)
         
         # Get details for selected restaurant
-        restaurant_details = self.google_service.get_restaurant_details(selected_place_id)
+        restaurant_details = await _google_service.get_restaurant_details(selected_place_id)
         
         if 'error_message' in restaurant_details:
             context = {'error': restaurant_details['error_message']}
@@ -54,20 +69,22 @@ class PricingView(View):
         longitude = location.get('lng', -73.5267)
         
         try:
-            # Get nearby restaurants
-            nearby_restaurants = self.google_service.search_nearby_restaurants(
-                latitude, 
-                longitude
-            )
-            
-            # Get current weather
-            weather_data = self.weather_service.get_current_weather(
+            # Get nearby restaurants first: without competitors there is nothing
+            # to price, so the weather lookup can be skipped
+            nearby_restaurants = await _google_service.search_nearby_restaurants(
                 latitude,
                 longitude
             )
             
-            # Get current busy level
-            current_busy_level = self.google_service.get_place_busy_times(selected_place_id)
+            busy_task = _google_service.get_place_busy_times(selected_place_id)
+            weather_available = bool(nearby_restaurants.get('results'))
+            if weather_available:
+                # Current weather and busy level are independent, so fetch them concurrently
+                weather_task = _weather_service.get_current_weather(latitude, longitude)
+                weather_data, current_busy_level = await asyncio.gather(weather_task, busy_task)
+            else:
+                weather_data = {}
+                current_busy_level = await busy_task
             
             # Get menu items (if available in Google Places API)
             menu_items = []
@@ -80,28 +97,36 @@ class PricingView(View):
                     {'name': 'Naan', 'price': 3.99},
                 ]
                 
-                # Calculate prices for sample menu items
-                for item in sample_menu_items:
-                    # Get competitor prices from nearby restaurants
-                    competitor_prices = []
-                    for restaurant in nearby_restaurants.get('results', [])[:5]:
-                        if restaurant.get('price_level'):
-                            competitor_price = item['price'] * (restaurant['price_level'] / 2)
-                            competitor_prices.append(competitor_price)
-                    
-                    if competitor_prices:
-                        new_price = self.pricing_service.calculate_price(
-                            item['price'],
-                            weather_data.get('main', {}),
-                            current_busy_level,
-                            competitor_prices
-                        )
-                        menu_items.append({
+                # Competitor price multipliers from nearby restaurants
+                price_levels = np.fromiter(
+                    (
+                        restaurant['price_level'] / 2
+                        for restaurant in islice(nearby_restaurants.get('results', ()), 5)
+                        if restaurant.get('price_level')
+                    ),
+                    dtype=float
+                )
+                
+                # Calculate prices for all sample menu items at once
+                if price_levels.size:
+                    base_prices = np.array([item['price'] for item in sample_menu_items])
+                    new_prices, price_changes = _pricing_service.calculate_menu(
+                        base_prices,
+                        weather_data.get('main', {}),
+                        current_busy_level,
+                        price_levels
+                    )
+                    menu_items = [
+                        {
                             'name': item['name'],
                             'original_price': item['price'],
                             'new_price': new_price,
-                            'price_change': ((new_price - item['price']) / item['price']) * 100
-                        })
+                            'price_change': price_change
+                        }
+                        for item, new_price, price_change in zip(
+                            sample_menu_items, new_prices.tolist(), price_changes.tolist()
+                        )
+                    ]
             
             context = {
                 'restaurant_details': {
@@ -110,7 +135,7 @@ class PricingView(View):
                     'rating': result.get('rating', 'N/A'),
                     'total_ratings': result.get('user_ratings_total', 0),
                     'price_level': '₹' * result.get('price_level', 1) if result.get('price_level') else 'N/A',
-                    'photos': result.get('photos', [])[:5]
+                    'photos': list(islice(result.get('photos', ()), 5))
                 },
                 'nearby_restaurants': [
                     {
@@ -120,15 +145,16 @@ class PricingView(View):
                         'price_level': '₹' * r.get('price_level', 1) if r.get('price_level') else 'N/A',
                         'distance': r.get('distance', 'N/A')
                     }
-                    for r in nearby_restaurants.get('results', [])[:5]
+                    for r in islice(nearby_restaurants.get('results', ()), 5)
                 ],
                 'weather_data': {
-                    'temperature_f': self.weather_service.kelvin_to_fahrenheit(
+                    'temperature_f': _weather_service.kelvin_to_fahrenheit(
                         weather_data.get('main', {}).get('temp', 293.15)  # Default to 20°C
                     ),
                     'condition': weather_data.get('weather', [{}])[0].get('main', 'Unknown'),
                     'description': weather_data.get('weather', [{}])[0].get('description', 'Weather data not available')
                 },
+                'weather_available': weather_available,
                 'busy_level': current_busy_level if isinstance(current_busy_level, (int, float)) else 50,
                 'menu_items': menu_items
             }